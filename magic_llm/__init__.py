@@ -1,28 +1,13 @@
-from magic_llm.base import MagicLlmBase
-from typing import Callable, Optional
-
 __version__ = '0.0.101'
 
+__all__ = ['MagicLLM', 'MagicLlmBase', '__version__']
 
-class MagicLLM(MagicLlmBase):
-
-    def __init__(self,
-                 engine: str,
-                 model: str | None = None,
-                 private_key: str | None = None,
-                 callback: Optional[Callable] = None,
-                 **kwargs):
-        super().__init__(engine=engine,
-                         model=model,
-                         private_key=private_key,
-                         callback=callback,
-                         **kwargs)
-
-    def download_embedding_search_model(self):
-        pass
-
-    def download_tagger_model(self):
-        pass
 
-    def download_tags_dictionary(self):
-        pass
+def __getattr__(name):
+    # Resolved on first access so `import magic_llm` does not load the client stack
+    if name in ('MagicLLM', 'MagicLlmBase'):
+        from magic_llm import base
+        value = getattr(base, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,56 +1,91 @@
-from magic_llm.engine import (EngineOpenAI,
-                              EngineGoogle,
-                              EngineCloudFlare,
-                              EngineAmazon,
-                              EngineCohere,
-                              EngineAnthropic,
-                              EngineAzure)
+import importlib
+from typing import Callable, Dict, Optional
+
+_RESOLVED = {}
+# Engines that authenticate with their own credentials instead of an api_key.
+_NO_API_KEY_ENGINES = frozenset({'amazon', 'azure'})
 
 
 class MagicLlmBase:
+    __slots__ = ('private_key', 'llm')
+
+    # Engines are resolved by name on first use so that only the selected backend
+    # (and its SDK dependencies, e.g. boto3 for amazon) gets imported.
+    ENGINE_MAP: Dict[str, str] = {
+        'openai': 'magic_llm.engine.engine_openai:EngineOpenAI',
+        'google': 'magic_llm.engine.engine_google:EngineGoogle',
+        'cloudflare': 'magic_llm.engine.engine_cloudflare:EngineCloudFlare',
+        'amazon': 'magic_llm.engine.engine_amazon:EngineAmazon',
+        'cohere': 'magic_llm.engine.engine_cohere:EngineCohere',
+        'anthropic': 'magic_llm.engine.engine_anthropic:EngineAnthropic',
+        'azure': 'magic_llm.engine.engine_azure:EngineAzure',
+    }
+
     def __init__(self,
                  engine: str,
                  private_key: str | None,
                  model: str | None = None,
                  **kwargs):
         self.private_key = private_key
-        if engine == 'openai':
-            self.llm = EngineOpenAI(
-                api_key=private_key,
-                model=model,
-                **kwargs
-            )
-        elif engine == 'google':
-            self.llm = EngineGoogle(
-                api_key=private_key,
-                model=model,
-                **kwargs
-            )
-        elif engine == 'cloudflare':
-            self.llm = EngineCloudFlare(
-                api_key=private_key,
-                model=model,
-                **kwargs
-            )
-        elif engine == 'amazon':
-            self.llm = EngineAmazon(
-                model=model,
-                **kwargs
-            )
-        elif engine == 'cohere':
-            self.llm = EngineCohere(
-                model=model,
-                api_key=private_key,
-                **kwargs
-            )
-        elif engine == 'anthropic':
-            self.llm = EngineAnthropic(
-                model=model,
-                api_key=private_key,
-                **kwargs
-            )
-        elif engine == 'azure':
-            self.llm = EngineAzure(
-                model=model,
-                **kwargs
-            )
+        # **kwargs is already a fresh dict owned by this call, fill it in place
+        kwargs['model'] = model
+        if engine not in _NO_API_KEY_ENGINES:
+            kwargs['api_key'] = private_key
+        self.llm = self._engine_class(engine)(**kwargs)
+
+    # The engine may hold connections (e.g. keep-alive sessions), release them through the facade
+    def close(self) -> None:
+        self.llm.close()
+
+    async def aclose(self) -> None:
+        await self.llm.aclose()
+
+    def __enter__(self):
+        self.llm.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self.llm.__exit__(exc_type, exc_val, exc_tb)
+
+    async def __aenter__(self):
+        await self.llm.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return await self.llm.__aexit__(exc_type, exc_val, exc_tb)
+
+    @classmethod
+    def _engine_class(cls, engine: str):
+        try:
+            path = cls.ENGINE_MAP[engine]
+        except KeyError:
+            raise ValueError(f'Unknown engine: {engine}') from None
+        if (engine_class := _RESOLVED.get(path)) is None:
+            module_name, class_name = path.split(':')
+            engine_class = getattr(importlib.import_module(module_name), class_name)
+            _RESOLVED[path] = engine_class
+        return engine_class
+
+
+class MagicLLM(MagicLlmBase):
+
+    def __init__(self,
+                 engine: str,
+                 model: str | None = None,
+                 private_key: str | None = None,
+                 callback: Optional[Callable] = None,
+                 **kwargs):
+        super().__init__(engine=engine,
+                         model=model,
+                         private_key=private_key,
+                         callback=callback,
+                         **kwargs)
+
+    def download_embedding_search_model(self):
+        pass
+
+    def download_tagger_model(self):
+        pass
+
+    def download_tags_dictionary(self):
+        pass
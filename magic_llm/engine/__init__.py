@@ -1,7 +1,23 @@
-from magic_llm.engine.engine_openai import EngineOpenAI
-from magic_llm.engine.engine_google import EngineGoogle
-from magic_llm.engine.engine_cloudflare import EngineCloudFlare
-from magic_llm.engine.engine_amazon import EngineAmazon
-from magic_llm.engine.engine_cohere import EngineCohere
-from magic_llm.engine.engine_anthropic import EngineAnthropic
-from magic_llm.engine.engine_azure import EngineAzure
+import importlib
+
+# Engines are imported on first access so loading one backend does not pull in the
+# SDK dependencies of all the others.
+_LAZY = {
+    'EngineOpenAI': 'magic_llm.engine.engine_openai',
+    'EngineGoogle': 'magic_llm.engine.engine_google',
+    'EngineCloudFlare': 'magic_llm.engine.engine_cloudflare',
+    'EngineAmazon': 'magic_llm.engine.engine_amazon',
+    'EngineCohere': 'magic_llm.engine.engine_cohere',
+    'EngineAnthropic': 'magic_llm.engine.engine_anthropic',
+    'EngineAzure': 'magic_llm.engine.engine_azure',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if (module := _LAZY.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,11 @@
 from typing import Iterator, AsyncIterator, Callable, Awaitable, Optional, Union, List, Any
 import abc
+import collections
 import functools
 import asyncio
+import os
+import random
+import threading
 import time
 import logging
 from dataclasses import dataclass
@@ -9,25 +13,311 @@ from concurrent.futures import ThreadPoolExecutor
 
 from magic_llm.model import ModelChat, ModelChatResponse
 from magic_llm.model.ModelAudio import AudioSpeechRequest, AudioTranscriptionsRequest
-from magic_llm.model.ModelChatStream import ChatCompletionModel, UsageModel, ChatMetaModel
+from magic_llm.model.ModelChatStream import ChatCompletionModel, ChoiceModel, DeltaModel, UsageModel, ChatMetaModel
+from magic_llm.util.cache import LRUCache, make_key
 
 logger = logging.getLogger(__name__)
 
+# Monotonic clock for every latency figure, bound once for the stream loops
+_now_ns = time.perf_counter_ns
 
-@dataclass
+_BACKGROUND_LOOP = None
+_BACKGROUND_LOCK = threading.Lock()
+# Sync callbacks run on a pool shared by every engine instead of the loop's default
+# executor, so a slow callback can't starve other work queued there.
+_CALLBACK_EXECUTOR = None
+_CALLBACK_EXECUTOR_LOCK = threading.Lock()
+# Strong references to fire-and-forget callback tasks, the loop only keeps weak ones
+_PENDING_TASKS = set()
+
+
+def _log_callback_failure(future) -> None:
+    if not future.cancelled() and (e := future.exception()) is not None:
+        logger.error(f"Callback execution failed: {e}", exc_info=e)
+
+
+def _callback_executor() -> ThreadPoolExecutor:
+    """Shared pool for sync callbacks of engines without their own executor."""
+    global _CALLBACK_EXECUTOR
+    if _CALLBACK_EXECUTOR is None:
+        with _CALLBACK_EXECUTOR_LOCK:
+            if _CALLBACK_EXECUTOR is None:
+                _CALLBACK_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2),
+                                                        thread_name_prefix='magic-llm-cb')
+    return _CALLBACK_EXECUTOR
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop on a daemon thread for running coroutine callbacks from sync code."""
+    global _BACKGROUND_LOOP
+    if _BACKGROUND_LOOP is None:
+        with _BACKGROUND_LOCK:
+            if _BACKGROUND_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='magic-llm-loop', daemon=True).start()
+                _BACKGROUND_LOOP = loop
+    return _BACKGROUND_LOOP
+
+
+@dataclass(slots=True)
 class RetryConfig:
     attempts: int
-    delay: float = 1.0
+    delay: float = 0.5
+    max_delay: float = 8.0
+    factor: float = 2.0
 
+    def backoff(self, attempt: int) -> float:
+        """Capped exponential backoff with jitter so concurrent retries spread out."""
+        return min(self.max_delay, self.delay * self.factor ** attempt) * (0.5 + random.random())
 
-@dataclass
+
+@dataclass(slots=True)
 class Metrics:
-    start_time: float = 0.0
-    ttfb: float = 0.0
-    generation_time: float = 0.0
+    # perf_counter_ns stamps, converted to seconds only when reported
+    start_ns: int = 0
+    first_token_ns: int = 0
+
+    @property
+    def ttfb(self) -> float:
+        return (self.first_token_ns - self.start_ns) * 1e-9
 
     def calculate_ttf(self) -> float:
-        return time.time() - self.start_time - self.ttfb
+        """Seconds spent generating, from the first token until now."""
+        return (_now_ns() - self.first_token_ns) * 1e-9
+
+    def elapsed(self) -> float:
+        return (_now_ns() - self.start_ns) * 1e-9
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Routes requests straight to the fallback while the primary keeps failing.
+
+    After `failure_threshold` consecutive failed requests the circuit opens. Once
+    `reset_timeout` seconds pass it goes half-open and lets a single request probe
+    the primary: success closes the circuit, failure opens it again.
+    """
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    state: str = 'closed'
+    failures: int = 0
+    opened_at: float = 0.0
+
+    def allow_request(self) -> bool:
+        if self.state == 'closed':
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            # Let one request probe the primary. The timer is re-armed so a probe that
+            # never reports back (e.g. an abandoned stream) can't hold it half-open.
+            self.state = 'half-open'
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = 'closed'
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == 'half-open' or self.failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self) -> None:
+        """Open the circuit right away, regardless of the failure count."""
+        self.state = 'open'
+        self.opened_at = time.monotonic()
+
+
+async def _with_chunk_timeout(stream: AsyncIterator, timeout: float) -> AsyncIterator:
+    """Re-yield `stream`, raising TimeoutError when the next chunk takes longer than `timeout`."""
+    it = stream.__aiter__()
+    while True:
+        try:
+            item = await asyncio.wait_for(it.__anext__(), timeout)
+        except StopAsyncIteration:
+            return
+        yield item
+
+
+_STREAM_END = object()
+
+
+async def _prefetch(stream: AsyncIterator, size: int) -> AsyncIterator:
+    """Re-yield `stream`, reading up to `size` items ahead in a background task."""
+    queue = asyncio.Queue(maxsize=size)
+    error = None
+
+    async def produce():
+        nonlocal error
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            error = e
+        # Not in a finally: once cancelled nothing reads the queue, and a put on a
+        # full queue would block the task forever
+        await queue.put(_STREAM_END)
+
+    task = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not _STREAM_END:
+            yield item
+        if error is not None:
+            raise error
+    finally:
+        # The consumer may leave early (break, aclose, cancellation): stop the producer
+        # and wait for it before closing the upstream it was iterating
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        if (aclose := getattr(stream, 'aclose', None)) is not None:
+            await aclose()
+
+
+class _AsyncChunkDispatcher:
+    """Delivers chunk batches in order from one background task, so a slow chunk callback
+    doesn't hold up the stream. close() waits for the batches already handed over."""
+    __slots__ = ('_queue', '_task')
+
+    def __init__(self, deliver: Callable[[List[ChatCompletionModel]], Awaitable[None]]):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run(deliver))
+
+    async def _run(self, deliver) -> None:
+        while (batch := await self._queue.get()) is not _STREAM_END:
+            await deliver(batch)
+
+    def submit(self, batch: List[ChatCompletionModel]) -> None:
+        self._queue.put_nowait(batch)
+
+    async def close(self) -> None:
+        if not self._task.done():
+            self._queue.put_nowait(_STREAM_END)
+            await self._task
+
+
+class _SyncChunkDispatcher:
+    """Sync-stream counterpart of _AsyncChunkDispatcher: batches are drained in order by at
+    most one executor task at a time."""
+    __slots__ = ('_deliver', '_executor', '_pending', '_lock', '_idle')
+
+    def __init__(self, deliver: Callable[[List[ChatCompletionModel]], None], executor: ThreadPoolExecutor):
+        self._deliver = deliver
+        self._executor = executor
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def submit(self, batch: List[ChatCompletionModel]) -> None:
+        with self._lock:
+            self._pending.append(batch)
+            if not self._idle.is_set():
+                # The running drain picks it up
+                return
+            self._idle.clear()
+        self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._idle.set()
+                    return
+                batch = self._pending.popleft()
+            self._deliver(batch)
+
+    def close(self) -> None:
+        self._idle.wait()
+
+
+def _merge_chunks(last: ChatCompletionModel, parts: List[str]) -> ChatCompletionModel:
+    if len(parts) == 1:
+        return last
+    # Copy: the originals may still be referenced by the chunk callback
+    merged = last.model_copy(deep=True)
+    merged.choices[0].delta.content = ''.join(parts)
+    return merged
+
+
+async def _coalesce(stream: AsyncIterator[ChatCompletionModel], size: int,
+                    interval: float) -> AsyncIterator[ChatCompletionModel]:
+    """Merge consecutive content chunks until `size` characters or `interval` seconds pile up.
+
+    The window is checked as chunks arrive, so a pending merge is emitted with the next
+    chunk, or when the stream ends. Chunks without content flush the pending merge and pass
+    through as they are.
+    """
+    parts = []
+    pending = 0
+    last = None
+    flushed_at = time.perf_counter()
+    async for item in stream:
+        if content := item.choices[0].delta.content:
+            parts.append(content)
+            pending += len(content)
+            last = item
+            now = time.perf_counter()
+            if pending >= size or now - flushed_at >= interval:
+                yield _merge_chunks(last, parts)
+                parts = []
+                pending = 0
+                flushed_at = now
+            continue
+        if parts:
+            yield _merge_chunks(last, parts)
+            parts = []
+            pending = 0
+            flushed_at = time.perf_counter()
+        yield item
+    if parts:
+        yield _merge_chunks(last, parts)
+
+
+# Client errors (bad request, auth, unknown model) fail the same way on every attempt
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 422})
+# Bad credentials or an unknown model won't recover for later requests either
+_DEAD_ENDPOINT_STATUS = frozenset({401, 403, 404})
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    # aiohttp errors carry .status, requests errors .response.status_code and
+    # botocore errors the parsed response dict
+    status = getattr(error, 'status', None)
+    if status is None and (response := getattr(error, 'response', None)) is not None:
+        if isinstance(response, dict):
+            status = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        else:
+            status = getattr(response, 'status_code', None)
+    return status
+
+
+def _is_retryable(error: Exception) -> bool:
+    return _status_code(error) not in _NON_RETRYABLE_STATUS
+
+
+def _from_cache(item):
+    """Copy of a cached response or chunk, its timings belong to the original request."""
+    item = item.model_copy(deep=True)
+    if (usage := item.usage) is not None:
+        usage.ttft = usage.ttf = usage.tps = 0.0
+    return item
+
+
+def _cache_hit_meta() -> ChatMetaModel:
+    # Reported to the completion callback so accounting can tell hits from upstream calls
+    return ChatMetaModel.model_construct(TTFB=0.0, TTF=0.0, TPS=0.0, status='cached')
+
+
+def _error_chunk(model: Optional[str], message: str) -> ChatCompletionModel:
+    """Terminal chunk reporting a failed stream; built unvalidated since the fields are ours."""
+    return ChatCompletionModel.model_construct(
+        id='id',
+        model=model or '',
+        choices=[ChoiceModel.model_construct(delta=DeltaModel.model_construct(content=message, role=None),
+                                             finish_reason=f'error: {message}',
+                                             index=0)]
+    )
 
 
 class ChatException(Exception):
@@ -36,6 +326,12 @@ class ChatException(Exception):
 
 
 class BaseChat(abc.ABC):
+    # Engines without their own __slots__ still get a __dict__ for their attributes
+    __slots__ = ('model', 'headers', '_callback', '_callback_is_coro', 'fallback', 'retry_config',
+                 'executor', 'circuit_breaker', 'chunk_timeout', '_chunk_callback', '_chunk_callback_is_coro',
+                 'callback_batch_size', 'stream_buffer', 'coalesce_size', 'coalesce_interval', 'cache',
+                 'await_callback', 'stream_metrics', 'kwargs')
+
     def __init__(
             self,
             model: str | None,
@@ -44,6 +340,16 @@ class BaseChat(abc.ABC):
             fallback: Optional[Callable] = None,
             retries: int = 3,
             executor: Optional[ThreadPoolExecutor] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            chunk_timeout: Optional[float] = None,
+            chunk_callback: Optional[Callable] = None,
+            callback_batch_size: int = 1,
+            stream_buffer: int = 0,
+            coalesce_size: int = 0,
+            coalesce_interval: float = 0.025,
+            cache: Optional[LRUCache] = None,
+            await_callback: bool = True,
+            stream_metrics: bool = True,
             **kwargs
     ):
         self.model = model
@@ -51,19 +357,82 @@ class BaseChat(abc.ABC):
         self.callback = callback
         self.fallback = fallback
         self.retry_config = RetryConfig(retries)
-        self.executor = executor or ThreadPoolExecutor()
+        self.executor = executor
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # Max seconds to wait between streamed chunks (async streams), None waits forever
+        self.chunk_timeout = chunk_timeout
+        # Optional incremental callback, called with lists of up to callback_batch_size chunks
+        self.chunk_callback = chunk_callback
+        self.callback_batch_size = max(1, callback_batch_size)
+        # Chunks read ahead of the consumer in async streams, 0 reads in lockstep
+        self.stream_buffer = stream_buffer
+        # Async streams merge content chunks up to this many characters or seconds, 0 disables
+        self.coalesce_size = coalesce_size
+        self.coalesce_interval = coalesce_interval
+        # Responses to deterministic (temperature=0) generate calls, None disables caching
+        self.cache = cache
+        # With False the completion callback runs in the background and its errors are only logged
+        self.await_callback = await_callback
+        # Stamp ttft/ttf/tps on streamed usage chunks; without it and without callbacks
+        # streams are relayed as they arrive
+        self.stream_metrics = stream_metrics
         self.kwargs = kwargs
 
+    @property
+    def callback(self) -> Optional[Callable]:
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: Optional[Callable]) -> None:
+        # Resolve how the callback is dispatched once, not on every completion
+        self._callback = callback
+        self._callback_is_coro = callback is not None and asyncio.iscoroutinefunction(callback)
+
+    @property
+    def chunk_callback(self) -> Optional[Callable]:
+        return self._chunk_callback
+
+    @chunk_callback.setter
+    def chunk_callback(self, chunk_callback: Optional[Callable]) -> None:
+        self._chunk_callback = chunk_callback
+        self._chunk_callback_is_coro = chunk_callback is not None and asyncio.iscoroutinefunction(chunk_callback)
+
+    @classmethod
+    def configure_callback_executor(cls, max_workers: Optional[int] = None) -> None:
+        """Replace the shared callback pool used by engines without their own executor."""
+        global _CALLBACK_EXECUTOR
+        with _CALLBACK_EXECUTOR_LOCK:
+            previous = _CALLBACK_EXECUTOR
+            _CALLBACK_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='magic-llm-cb')
+        if previous is not None:
+            previous.shutdown(wait=False)
+
     @staticmethod
     def _create_chat_meta_model(ttfb: float, ttf: float, usage: Optional[UsageModel]) -> ChatMetaModel:
         """Create a ChatMetaModel with calculated metrics."""
         try:
-            tps = usage.completion_tokens / ttf if usage and ttf > 0 else 0
+            # Cached responses can finish within timer resolution, don't divide by ~0
+            tps = (usage.completion_tokens or 0) / ttf if usage and ttf > 1e-9 else 0.0
             return ChatMetaModel(TTFB=ttfb, TTF=ttf, TPS=tps)
         except Exception as e:
             logger.error(f"Error creating chat meta model: {e}")
             return ChatMetaModel(TTFB=ttfb, TTF=ttf, TPS=0)
 
+    def _cache_key(self, chat: ModelChat, kwargs: dict, kind: str = 'generate') -> Optional[str]:
+        """Cache key for a generate or stream call, None when the call is not cacheable."""
+        if self.cache is None:
+            return None
+        params = {**self.kwargs, **kwargs}
+        # Sampled completions are expected to differ between calls
+        if params.get('temperature') != 0:
+            return None
+        return make_key(self.model, chat.get_messages(), params, kind)
+
+    @staticmethod
+    def _error_meta(elapsed: float, error: str) -> ChatMetaModel:
+        """Meta reported to the callback for a failed attempt, our own fields so unvalidated."""
+        return ChatMetaModel.model_construct(TTFB=elapsed, TTF=0.0, TPS=0.0, status='ERROR: ' + error)
+
     async def _execute_callback(
             self,
             chat: ModelChat,
@@ -73,16 +442,18 @@ class BaseChat(abc.ABC):
             meta: Optional[ChatMetaModel]
     ) -> None:
         """Execute callback with proper async/sync handling."""
-        if not self.callback:
+        if not self._callback:
             return
 
         try:
-            if asyncio.iscoroutinefunction(self.callback):
-                await self.callback(chat, response_content, usage, model, meta)
+            if not self.await_callback:
+                self._dispatch_callback(True, chat, response_content, usage, model, meta)
+            elif self._callback_is_coro:
+                await self._callback(chat, response_content, usage, model, meta)
             else:
-                await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    self.callback,
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executor or _callback_executor(),
+                    self._callback,
                     chat,
                     response_content,
                     usage,
@@ -90,19 +461,87 @@ class BaseChat(abc.ABC):
                     meta
                 )
         except Exception as e:
-            logger.error(f"Callback execution failed: {e}")
+            logger.error(f"Callback execution failed: {e}", exc_info=True)
+
+    def _execute_callback_sync(
+            self,
+            chat: ModelChat,
+            response_content: str,
+            usage: Optional[UsageModel],
+            model: str,
+            meta: Optional[ChatMetaModel]
+    ) -> None:
+        """Execute callback from the sync interceptors without an event loop per call."""
+        if not self._callback:
+            return
+
+        try:
+            if not self.await_callback:
+                self._dispatch_callback(False, chat, response_content, usage, model, meta)
+            elif self._callback_is_coro:
+                asyncio.run_coroutine_threadsafe(
+                    self._callback(chat, response_content, usage, model, meta),
+                    _background_loop()
+                ).result()
+            else:
+                self._callback(chat, response_content, usage, model, meta)
+        except Exception as e:
+            logger.error(f"Callback execution failed: {e}", exc_info=True)
+
+    def _dispatch_callback(self, in_loop: bool, *args) -> None:
+        """Start the callback without waiting for it to finish."""
+        if not self._callback_is_coro:
+            future = (self.executor or _callback_executor()).submit(self._callback, *args)
+        elif in_loop:
+            future = asyncio.get_running_loop().create_task(self._callback(*args))
+            _PENDING_TASKS.add(future)
+            future.add_done_callback(_PENDING_TASKS.discard)
+        else:
+            future = asyncio.run_coroutine_threadsafe(self._callback(*args), _background_loop())
+        future.add_done_callback(_log_callback_failure)
+
+    async def _execute_chunk_callback(self, chunks: List[ChatCompletionModel]) -> None:
+        """Deliver a batch of streamed chunks to the chunk callback."""
+        try:
+            if self._chunk_callback_is_coro:
+                await self.chunk_callback(chunks)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executor or _callback_executor(),
+                    self.chunk_callback,
+                    chunks
+                )
+        except Exception as e:
+            logger.error(f"Chunk callback execution failed: {e}", exc_info=True)
+
+    def _sync_execute_chunk_callback(self, chunks: List[ChatCompletionModel]) -> None:
+        """Deliver a batch of streamed chunks to the chunk callback from a sync stream."""
+        try:
+            if self._chunk_callback_is_coro:
+                asyncio.run_coroutine_threadsafe(self.chunk_callback(chunks), _background_loop()).result()
+            else:
+                self.chunk_callback(chunks)
+        except Exception as e:
+            logger.error(f"Chunk callback execution failed: {e}", exc_info=True)
 
     def _update_metrics(self, item: ChatCompletionModel, metrics: Metrics, usage: Optional[UsageModel]) -> None:
         """Update metrics for a chat completion item."""
         try:
-            generation_time = time.time() - metrics.generation_time
+            ttf = metrics.calculate_ttf()
             item.usage.ttft = metrics.ttfb
-            item.usage.ttf = metrics.calculate_ttf()
-            if generation_time > 0 and usage:
-                item.usage.tps = usage.completion_tokens / generation_time
+            item.usage.ttf = ttf
+            if ttf > 1e-9 and usage:
+                item.usage.tps = (usage.completion_tokens or 0) / ttf
         except Exception as e:
             logger.error(f"Error updating metrics: {e}")
 
+    def _record_failure(self, error: Exception) -> None:
+        if _status_code(error) in _DEAD_ENDPOINT_STATUS:
+            # Send the following requests straight to the fallback for the reset timeout
+            self.circuit_breaker.trip()
+        else:
+            self.circuit_breaker.record_failure()
+
     def _handle_fallback(self, is_async: bool = False) -> Optional[Callable]:
         """Configure and return appropriate fallback handler."""
         if not self.fallback:
@@ -118,79 +557,140 @@ class BaseChat(abc.ABC):
 
     @staticmethod
     def async_intercept_stream_generate(func: Callable[..., Awaitable[AsyncIterator[ChatCompletionModel]]]):
-        @functools.wraps(func)
-        async def wrapper(self, chat: ModelChat, **kwargs) -> AsyncIterator[ChatCompletionModel]:
+        async def intercepted(self, chat: ModelChat, **kwargs) -> AsyncIterator[ChatCompletionModel]:
             model = self.model or kwargs.get('model')
             usage = None
-            response_content = ''
+            response_parts = []
+            # The text is only needed by the completion callback, don't collect it otherwise
+            append = response_parts.append if self._callback is not None else None
+            # Per-chunk settings, read once per call instead of once per chunk
+            batch_size = self.callback_batch_size if self.chunk_callback is not None else 0
+            # Deterministic streams are recorded so a repeat can be replayed from the cache
+            cache_key = self._cache_key(chat, kwargs, 'stream')
+            if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+                for i in cached:
+                    i = _from_cache(i)
+                    if i.usage is not None and i.usage.total_tokens:
+                        usage = i.usage
+                    if append is not None and (content := i.choices[0].delta.content):
+                        append(content)
+                    yield i
+                if self._callback is not None:
+                    await self._execute_callback(chat, ''.join(response_parts), usage, model, _cache_hit_meta())
+                return
+            collected = [] if cache_key is not None else None
+            instrument = self.stream_metrics or append is not None or batch_size or collected is not None
             metrics = Metrics()
 
-            for attempt in range(self.retry_config.attempts):
+            if self.fallback and not self.circuit_breaker.allow_request():
+                async for i in self._handle_fallback(is_async=True)(chat):
+                    yield i
+                return
+
+            retry = self.retry_config
+            last_attempt = retry.attempts - 1
+            for attempt in range(retry.attempts):
+                dispatcher = _AsyncChunkDispatcher(self._execute_chunk_callback) if batch_size else None
                 try:
-                    metrics.start_time = time.time()
+                    metrics.start_ns = _now_ns()
                     first_token_received = False
-                    current_item = None
-
-                    async for item in func(self, chat, **kwargs):
-                        current_item = item
-                        if not first_token_received:
-                            metrics.ttfb = time.time() - metrics.start_time
-                            metrics.generation_time = time.time()
+                    n = 0
+                    batch = []
+
+                    stream = func(self, chat, **kwargs)
+                    if self.chunk_timeout is not None:
+                        # A stalled upstream surfaces as TimeoutError and goes through retry/fallback
+                        stream = _with_chunk_timeout(stream, self.chunk_timeout)
+                    if self.stream_buffer > 0:
+                        # Overlap the upstream reads with the consumer's work on each chunk
+                        stream = _prefetch(stream, self.stream_buffer)
+                    if not instrument:
+                        # Nothing reads timings, usage or text: relay the chunks untouched
+                        async for item in stream:
                             first_token_received = True
-
-                        if item.usage.total_tokens:
-                            usage = item.usage
-                        if content := item.choices[0].delta.content:
-                            response_content += content
-                        yield item
-
-                    if first_token_received and current_item:
-                        self._update_metrics(current_item, metrics, usage)
-                        yield current_item
-
+                            yield item
+                            n += 1
+                            if not n & 31:
+                                await asyncio.sleep(0)
+                    else:
+                        async for item in stream:
+                            if not first_token_received:
+                                metrics.first_token_ns = _now_ns()
+                                first_token_received = True
+
+                            if (item_usage := item.usage).total_tokens:
+                                usage = item_usage
+                                # Stamp timings on the chunks that report usage, the last one
+                                # carries the final figures
+                                self._update_metrics(item, metrics, usage)
+                            if append is not None and (content := item.choices[0].delta.content):
+                                append(content)
+                            if batch_size:
+                                batch.append(item)
+                                if len(batch) >= batch_size:
+                                    dispatcher.submit(batch)
+                                    batch = []
+                            if collected is not None:
+                                collected.append(item)
+                            yield item
+                            # Streams that buffer chunks never suspend between them; let other
+                            # tasks on the loop run every 32 chunks.
+                            n += 1
+                            if not n & 31:
+                                await asyncio.sleep(0)
+
+                    if dispatcher is not None:
+                        if batch:
+                            dispatcher.submit(batch)
+                        # Chunk callbacks see the whole stream before the completion callback
+                        await dispatcher.close()
+                    if first_token_received and self._callback is not None:
                         meta = self._create_chat_meta_model(
                             metrics.ttfb,
                             metrics.calculate_ttf(),
                             usage
                         )
-                        await self._execute_callback(chat, response_content, usage, model, meta)
+                        await self._execute_callback(chat, ''.join(response_parts), usage, model, meta)
+                    self.circuit_breaker.record_success()
+                    if collected:
+                        self.cache.set(cache_key, [i.model_copy(deep=True) for i in collected])
                     break
 
                 except Exception as e:
                     er = f"Stream generation attempt {attempt + 1} failed: {e}"
-                    logger.error(er)
-                    await self._execute_callback(chat,
-                                                 response_content,
-                                                 usage,
-                                                 model,
-                                                 ChatMetaModel(
-                                                     TTFB=time.time() - metrics.start_time,
-                                                     TTF=0,
-                                                     TPS=0,
-                                                     status='ERROR: ' + er))
-
-                    if attempt == self.retry_config.attempts - 1:
+                    logger.error(er, exc_info=True)
+                    if self._callback is not None:
+                        await self._execute_callback(chat,
+                                                     ''.join(response_parts),
+                                                     usage,
+                                                     model,
+                                                     self._error_meta(metrics.elapsed(), er))
+
+                    # Once tokens reached the consumer a retry would replay them, so give up
+                    if (attempt == last_attempt or first_token_received
+                            or not _is_retryable(e)):
+                        self._record_failure(e)
                         fallback = self._handle_fallback(is_async=True)
                         if fallback:
                             async for i in fallback(chat):
                                 yield i
                         else:
-                            yield ChatCompletionModel(**{
-                                'model': self.model,
-                                'id': 'id',
-                                'choices': [
-                                    {
-                                        'delta': {
-                                            'content': er,
-                                            'role': None
-                                        },
-                                        'finish_reason': f'error: {er}',
-                                        'index': 0
-                                    }
-                                ]
-                            })
-                    else:
-                        await asyncio.sleep(self.retry_config.delay)
+                            yield _error_chunk(model, er)
+                        break
+                    await asyncio.sleep(retry.backoff(attempt))
+                finally:
+                    # Also reached when the consumer stops early or the stream fails
+                    if dispatcher is not None:
+                        await dispatcher.close()
+
+        @functools.wraps(func)
+        def wrapper(self, chat: ModelChat, **kwargs) -> AsyncIterator[ChatCompletionModel]:
+            # Coalescing sits outside the interceptor so TTFB, usage and callbacks see the
+            # upstream chunks as they arrive
+            stream = intercepted(self, chat, **kwargs)
+            if self.coalesce_size > 0:
+                return _coalesce(stream, self.coalesce_size, self.coalesce_interval)
+            return stream
 
         return wrapper
 
@@ -200,59 +700,110 @@ class BaseChat(abc.ABC):
         def wrapper(self, chat: ModelChat, **kwargs) -> Iterator[ChatCompletionModel]:
             model = self.model or kwargs.get('model')
             usage = None
-            response_content = ''
+            response_parts = []
+            # The text is only needed by the completion callback, don't collect it otherwise
+            append = response_parts.append if self._callback is not None else None
+            # Per-chunk settings, read once per call instead of once per chunk
+            batch_size = self.callback_batch_size if self.chunk_callback is not None else 0
+            # Deterministic streams are recorded so a repeat can be replayed from the cache
+            cache_key = self._cache_key(chat, kwargs, 'stream')
+            if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+                for i in cached:
+                    i = _from_cache(i)
+                    if i.usage is not None and i.usage.total_tokens:
+                        usage = i.usage
+                    if append is not None and (content := i.choices[0].delta.content):
+                        append(content)
+                    yield i
+                if self._callback is not None:
+                    self._execute_callback_sync(chat, ''.join(response_parts), usage, model, _cache_hit_meta())
+                return
+            collected = [] if cache_key is not None else None
+            instrument = self.stream_metrics or append is not None or batch_size or collected is not None
             metrics = Metrics()
 
-            for attempt in range(self.retry_config.attempts):
+            if self.fallback and not self.circuit_breaker.allow_request():
+                yield from self._handle_fallback(is_async=False)(chat)
+                return
+
+            retry = self.retry_config
+            last_attempt = retry.attempts - 1
+            for attempt in range(retry.attempts):
+                dispatcher = (_SyncChunkDispatcher(self._sync_execute_chunk_callback,
+                                                   self.executor or _callback_executor())
+                              if batch_size else None)
                 try:
-                    metrics.start_time = time.time()
+                    metrics.start_ns = _now_ns()
                     first_token_received = False
-                    current_item = None
+                    batch = []
 
-                    for item in func(self, chat, **kwargs):
-                        current_item = item
-                        if not first_token_received:
-                            metrics.ttfb = time.time() - metrics.start_time
-                            metrics.generation_time = time.time()
+                    if not instrument:
+                        # Nothing reads timings, usage or text: relay the chunks untouched
+                        for item in func(self, chat, **kwargs):
                             first_token_received = True
-
-                        if item.usage.total_tokens:
-                            usage = item.usage
-                        if content := item.choices[0].delta.content:
-                            response_content += content
-                        yield item
-
-                    if first_token_received and current_item:
-                        self._update_metrics(current_item, metrics, usage)
-                        yield current_item
-
+                            yield item
+                    else:
+                        for item in func(self, chat, **kwargs):
+                            if not first_token_received:
+                                metrics.first_token_ns = _now_ns()
+                                first_token_received = True
+
+                            if (item_usage := item.usage).total_tokens:
+                                usage = item_usage
+                                # Stamp timings on the chunks that report usage, the last one
+                                # carries the final figures
+                                self._update_metrics(item, metrics, usage)
+                            if append is not None and (content := item.choices[0].delta.content):
+                                append(content)
+                            if batch_size:
+                                batch.append(item)
+                                if len(batch) >= batch_size:
+                                    dispatcher.submit(batch)
+                                    batch = []
+                            if collected is not None:
+                                collected.append(item)
+                            yield item
+
+                    if dispatcher is not None:
+                        if batch:
+                            dispatcher.submit(batch)
+                        # Chunk callbacks see the whole stream before the completion callback
+                        dispatcher.close()
+                    if first_token_received and self._callback is not None:
                         meta = self._create_chat_meta_model(
                             metrics.ttfb,
                             metrics.calculate_ttf(),
                             usage
                         )
-                        asyncio.run(self._execute_callback(chat, response_content, usage, model, meta))
+                        self._execute_callback_sync(chat, ''.join(response_parts), usage, model, meta)
+                    self.circuit_breaker.record_success()
+                    if collected:
+                        self.cache.set(cache_key, [i.model_copy(deep=True) for i in collected])
                     break
 
                 except Exception as e:
                     er = f"Sync stream generation attempt {attempt + 1} failed: {e}"
-                    logger.error(er)
-                    asyncio.run(self._execute_callback(chat,
-                                                       response_content,
-                                                       usage,
-                                                       model,
-                                                       ChatMetaModel(
-                                                           TTFB=time.time() - metrics.start_time,
-                                                           TTF=0,
-                                                           TPS=0,
-                                                           status='ERROR: ' + er)))
-
-                    if attempt == self.retry_config.attempts - 1:
+                    logger.error(er, exc_info=True)
+                    if self._callback is not None:
+                        self._execute_callback_sync(chat,
+                                                    ''.join(response_parts),
+                                                    usage,
+                                                    model,
+                                                    self._error_meta(metrics.elapsed(), er))
+
+                    # Once tokens reached the consumer a retry would replay them, so give up
+                    if (attempt == last_attempt or first_token_received
+                            or not _is_retryable(e)):
+                        self._record_failure(e)
                         fallback = self._handle_fallback(is_async=False)
                         if fallback:
                             yield from fallback(chat)
-                    else:
-                        time.sleep(self.retry_config.delay)
+                        break
+                    time.sleep(retry.backoff(attempt))
+                finally:
+                    # Also reached when the consumer stops early or the stream fails
+                    if dispatcher is not None:
+                        dispatcher.close()
 
         return wrapper
 
@@ -261,38 +812,52 @@ class BaseChat(abc.ABC):
         @functools.wraps(func)
         async def wrapper(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
             model = self.model or kwargs.get('model')
-            for attempt in range(self.retry_config.attempts):
-                start_time = time.time()
+            if (cache_key := self._cache_key(chat, kwargs)) is not None:
+                if (cached := self.cache.get(cache_key)) is not None:
+                    response = _from_cache(cached)
+                    if self._callback is not None:
+                        await self._execute_callback(chat, response.content, response.usage, model, _cache_hit_meta())
+                    return response
+            if self.fallback and not self.circuit_breaker.allow_request():
+                return await self.fallback.llm.async_generate(chat)
+            retry = self.retry_config
+            last_attempt = retry.attempts - 1
+            for attempt in range(retry.attempts):
+                start_time = time.perf_counter()
                 usage = None
                 try:
                     response = await func(self, chat, **kwargs)
-                    ttf = time.time() - start_time
+                    ttf = time.perf_counter() - start_time
 
+                    # Stamp the response's own usage, the meta model is only built for a callback
                     usage = response.usage
-                    meta = self._create_chat_meta_model(0, ttf, usage)
-                    usage.tps = meta.TPS
-                    usage.ttf = meta.TTF
-                    usage.ttft = meta.TTFB
-
-                    await self._execute_callback(chat, response.content, usage, model, meta)
+                    usage.ttft = 0
+                    usage.ttf = ttf
+                    usage.tps = (usage.completion_tokens or 0) / ttf if ttf > 1e-9 else 0.0
+
+                    if self._callback is not None:
+                        meta = ChatMetaModel(TTFB=0, TTF=ttf, TPS=usage.tps)
+                        await self._execute_callback(chat, response.content, usage, model, meta)
+                    self.circuit_breaker.record_success()
+                    if cache_key is not None:
+                        self.cache.set(cache_key, response.model_copy(deep=True))
                     return response
 
                 except Exception as e:
                     er = f"Async generation attempt {attempt + 1} failed: {e}"
-                    logger.error(er)
-                    await self._execute_callback(chat,
-                                                 None,
-                                                 usage,
-                                                 model,
-                                                 ChatMetaModel(
-                                                     TTFB=time.time() - start_time,
-                                                     TTF=0,
-                                                     TPS=0,
-                                                     status='ERROR: ' + er))
-                    if attempt == self.retry_config.attempts - 1:
+                    logger.error(er, exc_info=True)
+                    if self._callback is not None:
+                        await self._execute_callback(chat,
+                                                     None,
+                                                     usage,
+                                                     model,
+                                                     self._error_meta(time.perf_counter() - start_time, er))
+                    if attempt == last_attempt or not _is_retryable(e):
+                        self._record_failure(e)
                         if self.fallback:
                             return await self.fallback.llm.async_generate(chat)
-                    await asyncio.sleep(self.retry_config.delay)
+                        break
+                    await asyncio.sleep(retry.backoff(attempt))
 
         return wrapper
 
@@ -301,38 +866,53 @@ class BaseChat(abc.ABC):
         @functools.wraps(func)
         def wrapper(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
             model = self.model or kwargs.get('model')
-            for attempt in range(self.retry_config.attempts):
+            if (cache_key := self._cache_key(chat, kwargs)) is not None:
+                if (cached := self.cache.get(cache_key)) is not None:
+                    response = _from_cache(cached)
+                    if self._callback is not None:
+                        self._execute_callback_sync(chat, response.content, response.usage, model, _cache_hit_meta())
+                    return response
+            if self.fallback and not self.circuit_breaker.allow_request():
+                return self.fallback.llm.generate(chat)
+            retry = self.retry_config
+            last_attempt = retry.attempts - 1
+            for attempt in range(retry.attempts):
                 usage = None
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     response = func(self, chat, **kwargs)
-                    ttf = time.time() - start_time
+                    ttf = time.perf_counter() - start_time
 
+                    # Stamp the response's own usage, the meta model is only built for a callback
                     usage = response.usage
-                    meta = self._create_chat_meta_model(0, ttf, usage)
-                    usage.tps = meta.TPS
-                    usage.ttf = meta.TTF
-                    usage.ttft = meta.TTFB
-                    asyncio.run(self._execute_callback(chat, response.content, usage, model, meta))
+                    usage.ttft = 0
+                    usage.ttf = ttf
+                    usage.tps = (usage.completion_tokens or 0) / ttf if ttf > 1e-9 else 0.0
+
+                    if self._callback is not None:
+                        meta = ChatMetaModel(TTFB=0, TTF=ttf, TPS=usage.tps)
+                        self._execute_callback_sync(chat, response.content, usage, model, meta)
+                    self.circuit_breaker.record_success()
+                    if cache_key is not None:
+                        self.cache.set(cache_key, response.model_copy(deep=True))
                     return response
 
                 except Exception as e:
                     er = f"Sync generation attempt {attempt + 1} failed: {e}"
-                    logger.error(er)
-                    asyncio.run(self._execute_callback(chat,
-                                                       None,
-                                                       usage,
-                                                       model,
-                                                       ChatMetaModel(
-                                                           TTFB=time.time() - start_time,
-                                                           TTF=0,
-                                                           TPS=0,
-                                                           status='ERROR: ' + er)))
-
-                    if attempt == self.retry_config.attempts - 1:
+                    logger.error(er, exc_info=True)
+                    if self._callback is not None:
+                        self._execute_callback_sync(chat,
+                                                    None,
+                                                    usage,
+                                                    model,
+                                                    self._error_meta(time.perf_counter() - start_time, er))
+
+                    if attempt == last_attempt or not _is_retryable(e):
+                        self._record_failure(e)
                         if self.fallback:
                             return self.fallback.llm.generate(chat)
-                    time.sleep(self.retry_config.delay)
+                        break
+                    time.sleep(retry.backoff(attempt))
 
         return wrapper
 
@@ -358,21 +938,39 @@ class BaseChat(abc.ABC):
 
     def embedding(self, text: Union[List[str], str], **kwargs) -> Any:
         """Generate embeddings for the given text."""
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not support embeddings')
 
-    async def async_audio_speech(self, speech_request: AudioSpeechRequest, **kwargs) -> Any:
+    async def async_audio_speech(self, data: AudioSpeechRequest, **kwargs) -> Any:
         """Generate audio speech asynchronously."""
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not support audio speech')
 
-    def audio_speech(self, speech_request: AudioSpeechRequest, **kwargs) -> Any:
+    def audio_speech(self, data: AudioSpeechRequest, **kwargs) -> Any:
         """Generate audio speech synchronously."""
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not support audio speech')
+
+    def close(self) -> None:
+        """Release resources owned by this engine.
+
+        The executor is the caller's and may be shared with other engines, it is left running,
+        as is the shared callback pool.
+        """
+
+    async def aclose(self) -> None:
+        """Async counterpart of close() for resources bound to an event loop."""
+        self.close()
 
-    def __del__(self):
-        """Cleanup resources."""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
+    def __enter__(self):
+        return self
 
-    async def async_audio_transcriptions(self, speech_request: AudioTranscriptionsRequest, **kwargs) -> Any:
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def async_audio_transcriptions(self, data: AudioTranscriptionsRequest, **kwargs) -> Any:
         """Generate audio transcriptions asynchronously."""
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not support audio transcriptions')
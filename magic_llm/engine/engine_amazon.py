@@ -1,310 +1,384 @@
+import asyncio
+import threading
 import time
-
-import aioboto3
-import boto3
-import json
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from magic_llm.engine.base_chat import BaseChat
 from magic_llm.model import ModelChatResponse, ModelChat
 from magic_llm.model.ModelAudio import AudioSpeechRequest
-from magic_llm.model.ModelChatStream import ChatCompletionModel, UsageModel
+from magic_llm.model.ModelChatStream import ChatCompletionModel, ChoiceModel, DeltaModel, UsageModel
+from magic_llm.util import fast_json
+
+# boto3 clients are thread-safe and own their connection pool, so engines with the
+# same credentials share one. Sessions are not thread-safe: only use under the lock.
+_SESSION = None
+_CLIENT_CACHE = {}
+_CLIENT_LOCK = threading.Lock()
+# botocore keeps 10 connections by default and drops the extras when more requests
+# are in flight; size the pool for concurrent async callers so TLS sessions are reused.
+_MAX_POOL_CONNECTIONS = 64
+
+
+def _empty_usage() -> UsageModel:
+    # Usage of every chunk before the final one, which carries the invocation metrics.
+    # Built per chunk: callers own the chunks they receive and may mutate them.
+    return UsageModel.model_construct(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+
+
+# Nova stopReason -> OpenAI finish_reason
+_NOVA_STOP_REASONS = MappingProxyType({
+    'end_turn': 'stop',
+    'stop_sequence': 'stop',
+    'max_tokens': 'length',
+    'tool_use': 'tool_calls',
+    'content_filtered': 'content_filter',
+})
+
+
+def _get_client(service_name: str, region_name: str, aws_access_key_id: str, aws_secret_access_key: str,
+                max_pool_connections: int = _MAX_POOL_CONNECTIONS):
+    """Shared (client, invoke executor, stream executor) for these credentials.
+
+    Async calls run the blocking client on the executors rather than on the loop's default
+    one, which they would monopolise for the whole model latency. One-shot invokes and
+    stream readers get separate pools of max_pool_connections threads each, so long-lived
+    streams can't starve invokes; the client keeps a connection for every thread.
+    """
+    global _SESSION
+    key = (service_name, region_name, aws_access_key_id, aws_secret_access_key, max_pool_connections)
+    if (entry := _CLIENT_CACHE.get(key)) is None:
+        with _CLIENT_LOCK:
+            if (entry := _CLIENT_CACHE.get(key)) is None:
+                if _SESSION is None:
+                    import boto3
+                    _SESSION = boto3.session.Session()
+                from botocore.config import Config
+                client = _SESSION.client(
+                    service_name=service_name,
+                    region_name=region_name,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    config=Config(max_pool_connections=2 * max_pool_connections, tcp_keepalive=True)
+                )
+                # Threads are started on demand, idle pools cost nothing
+                entry = (client,
+                         ThreadPoolExecutor(max_workers=max_pool_connections,
+                                            thread_name_prefix='magic-llm-bedrock'),
+                         ThreadPoolExecutor(max_workers=max_pool_connections,
+                                            thread_name_prefix='magic-llm-bedrock-stream'))
+                _CLIENT_CACHE[key] = entry
+    return entry
+
+
+def _model_family(model: str | None) -> str | None:
+    """Bedrock model family, which decides the request body and the response shape."""
+    if not model:
+        return None
+    if model.startswith('amazon.nova'):
+        return 'nova'
+    if model.startswith('amazon'):
+        return 'titan'
+    if model.startswith('anthropic'):
+        return 'anthropic'
+    if model.startswith('meta'):
+        return 'meta'
+    return None
+
+
+_STREAM_END = object()
+
+
+async def _iterate_in_thread(body, executor: ThreadPoolExecutor, transform=iter):
+    """Drain a blocking botocore EventStream on a worker thread, handing items to the loop as they arrive.
+
+    ``transform`` maps the body to the items to hand over, so decoding runs on the reader
+    thread, overlapped with the network reads, instead of on the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    error = None
+    abandoned = False
+
+    def produce():
+        nonlocal error
+        if abandoned:
+            # The consumer left while this stream was queued for a worker
+            return
+        try:
+            for item in transform(body):
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        except Exception as e:
+            error = e
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    executor.submit(produce)
+    finished = False
+    try:
+        while (item := await queue.get()) is not _STREAM_END:
+            yield item
+        finished = True
+        if error is not None:
+            raise error
+    finally:
+        if not finished:
+            # Consumer stopped early, closing the body ends the producer's read
+            abandoned = True
+            body.close()
 
 
 class EngineAmazon(BaseChat):
+    __slots__ = ('region_name', 'service_name', 'aws_access_key_id', 'aws_secret_access_key', 'client',
+                 '_invoke_executor', '_stream_executor', '_family')
+
+    # Default inference parameters per model family, overridable through kwargs
+    _NOVA_DEFAULTS = {
+        "max_new_tokens": 4096,
+        "temperature": 1,
+        "topP": 1,
+    }
+    _TITAN_DEFAULTS = {
+        "maxTokenCount": 4096,
+        "temperature": 0,
+        "topP": 1,
+        "stopSequences": ("User:",),
+    }
+    _CLAUDE_DEFAULTS = {
+        "max_tokens_to_sample": 1024,
+        "temperature": 0.5,
+        "top_k": 250,
+        "top_p": 1,
+        "stop_sequences": ("\n\nHuman:",),
+        # "anthropic_version": "bedrock-2023-05-31"
+    }
+    _LLAMA_DEFAULTS = {
+        "max_gen_len": 1024,
+        "temperature": 0.2,
+        "top_p": 1,
+        # "stop_sequences": ("[/INST]",),
+    }
+
     def __init__(self,
                  aws_access_key_id: str,
                  aws_secret_access_key: str,
                  region_name: str = 'us-east-1',
                  service_name: str = 'bedrock-runtime',
+                 max_pool_connections: int = _MAX_POOL_CONNECTIONS,
                  **kwargs):
         super().__init__(**kwargs)
         self.region_name = region_name
+        self.service_name = service_name
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
-        self.client = boto3.client(
-            service_name=service_name,
-            region_name=region_name,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key
-        )
-        self.aclient = aioboto3.Session().client(
-            service_name=service_name,
-            region_name=region_name,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key
-        )
+        # max_pool_connections bounds the concurrent async invokes and, separately, streams
+        self.client, self._invoke_executor, self._stream_executor = _get_client(
+            service_name, region_name, aws_access_key_id, aws_secret_access_key, max_pool_connections)
+        # Resolved once: every request, response and stream event dispatches on it
+        self._family = _model_family(self.model)
 
     def prepare_data(self, chat: ModelChat, **kwargs):
-        if self.model.startswith('amazon.nova'):
-            m = chat.get_messages()
-            for i in m:
-                i['content'] = [{
-                    "text": i['content']
-                }]
-            body = json.dumps({
+        if self._family == 'nova':
+            # Build new message dicts: wrapping in place would corrupt the chat on retries.
+            # Content that is already a list of blocks is passed through unchanged.
+            m = [{**i, 'content': [{"text": c}]} if isinstance(c := i['content'], str) else i
+                 for i in chat.get_messages()]
+            body = fast_json.dumps({
                 "messages": m,
-                "inferenceConfig": {
-                    "max_new_tokens": kwargs.get('max_new_tokens', 4096),
-                    "temperature": kwargs.get('temperature', 1),
-                    "topP": kwargs.get('topP', 1)
-                }
+                "inferenceConfig": {k: kwargs.get(k, v) for k, v in self._NOVA_DEFAULTS.items()}
             })
 
-        elif self.model.startswith('amazon'):
-            body = json.dumps({
+        elif self._family == 'titan':
+            body = fast_json.dumps({
                 "inputText": chat.generic_chat(format='titan'),
-                "textGenerationConfig": {
-                    "maxTokenCount": kwargs.get('maxTokenCount', 4096),
-                    "temperature": kwargs.get('temperature', 0),
-                    "topP": kwargs.get('topP', 1),
-                    "stopSequences": kwargs.get('stopSequences', ['User:']),
-                }
+                "textGenerationConfig": {k: kwargs.get(k, v) for k, v in self._TITAN_DEFAULTS.items()}
             })
-        elif self.model.startswith('anthropic'):
-            body = json.dumps({
+        elif self._family == 'anthropic':
+            body = fast_json.dumps({
                 "prompt": chat.generic_chat(format='claude'),
-                "max_tokens_to_sample": kwargs.get('max_tokens_to_sample', 1024),
-                "temperature": kwargs.get('temperature', 0.5),
-                "top_k": kwargs.get('top_k', 250),
-                "top_p": kwargs.get('top_p', 1),
-                "stop_sequences": kwargs.get('stop_sequences', ["\n\nHuman:"]),
-                # "anthropic_version": "bedrock-2023-05-31"
+                **{k: kwargs.get(k, v) for k, v in self._CLAUDE_DEFAULTS.items()}
             })
-        elif self.model.startswith('meta'):
-            body = json.dumps({
+        elif self._family == 'meta':
+            body = fast_json.dumps({
                 "prompt": chat.generic_chat(format='llama2'),
-                "max_gen_len": kwargs.get('max_gen_len', 1024),
-                "temperature": kwargs.get('temperature', 0.2),
-                "top_p": kwargs.get('top_p', 1),
-                # "stop_sequences": kwargs.get('stop_sequences', ["[/INST]"]),
+                **{k: kwargs.get(k, v) for k, v in self._LLAMA_DEFAULTS.items()}
             })
         else:
             raise Exception("Unknown model")
         return body
 
-    @BaseChat.async_intercept_generate
-    async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
-        async with self.aclient as client:
-            response = await client.invoke_model(
-                body=self.prepare_data(chat, **kwargs),
-                modelId=self.model,
-                accept='application/json',
-                contentType='application/json'
-            )
-
-            r = json.loads(await response['body'].read())
-            if self.model.startswith('amazon.nova'):
-                u = r.get('usage', {})
-                return ModelChatResponse(**{
-                    'content': r['output']['message']['content'][0]['text'],
-                    'role': 'assistant',
-                    'usage': UsageModel(
-                        prompt_tokens=u['inputTokens'],
-                        completion_tokens=u['outputTokens'],
-                        total_tokens=u['totalTokens']
-                    )
-                })
-            elif self.model.startswith('amazon'):
-                return ModelChatResponse(**{
-                    'content': r['results'][0]['outputText'],
-                    'role': 'assistant',
-                    'usage': UsageModel(
-                        prompt_tokens=r['inputTextTokenCount'],
-                        completion_tokens=r['results'][0]['tokenCount'],
-                        total_tokens=r['inputTextTokenCount'] + r['results'][0]['tokenCount'],
-                    )
-                })
-            elif self.model.startswith('anthropic'):
-                return ModelChatResponse(**{
-                    'content': r['completion'],
-                    'role': 'assistant',
-                    'usage': UsageModel(
-                        prompt_tokens=len(chat.generic_chat(format='claude')),
-                        completion_tokens=len(r['completion']),
-                        total_tokens=len(chat.generic_chat(format='claude')) + len(r['completion'])
-                    )
-                })
-            elif self.model.startswith('meta'):
-                return ModelChatResponse(**{
-                    'content': r['generation'],
-                    'role': 'assistant',
-                    'usage': UsageModel(
-                        prompt_tokens=r['prompt_token_count'],
-                        completion_tokens=r['generation_token_count'],
-                        total_tokens=r['prompt_token_count'] + r['generation_token_count']
-                    )
-                })
-
-    @BaseChat.sync_intercept_generate
-    def generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
-        response = self.client.invoke_model(body=self.prepare_data(chat, **kwargs),
-                                            modelId=self.model,
-                                            accept='application/json',
-                                            contentType='application/json')
-
-        r = json.loads(response.get('body').read())
+    @staticmethod
+    def _nova_text(content: list) -> str:
+        # Nova may return several content blocks (e.g. text mixed with tool use)
+        if len(content) == 1 and 'text' in content[0]:
+            return content[0]['text']
+        return ''.join([t for c in content if (t := c.get('text')) is not None])
 
-        if self.model.startswith('amazon.nova'):
+    def process_generate(self, r: dict, chat: ModelChat) -> ModelChatResponse:
+        if self._family == 'nova':
             u = r.get('usage', {})
-            return ModelChatResponse(**{
-                'content': r['output']['message']['content'][0]['text'],
-                'role': 'assistant',
-                'usage': UsageModel(
+            return ModelChatResponse(
+                content=self._nova_text(r['output']['message']['content']),
+                role='assistant',
+                usage=UsageModel(
                     prompt_tokens=u['inputTokens'],
                     completion_tokens=u['outputTokens'],
                     total_tokens=u['totalTokens']
                 )
-            })
-        elif self.model.startswith('amazon'):
-            return ModelChatResponse(**{
-                'content': r['results'][0]['outputText'],
-                'role': 'assistant',
-                'usage': UsageModel(
-                    prompt_tokens=r['inputTextTokenCount'],
-                    completion_tokens=r['results'][0]['tokenCount'],
-                    total_tokens=r['inputTextTokenCount'] + r['results'][0]['tokenCount'],
+            )
+        elif self._family == 'titan':
+            result = r['results'][0]
+            prompt_tokens = r['inputTextTokenCount']
+            completion_tokens = result['tokenCount']
+            return ModelChatResponse(
+                content=result['outputText'],
+                role='assistant',
+                usage=UsageModel(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
                 )
-            })
-        elif self.model.startswith('anthropic'):
-            return ModelChatResponse(**{
-                'content': r['completion'],
-                'role': 'assistant',
-                'usage': UsageModel(
-                    prompt_tokens=len(chat.generic_chat(format='claude')),
-                    completion_tokens=len(r['completion']),
-                    total_tokens=len(chat.generic_chat(format='claude')) + len(r['completion'])
+            )
+        elif self._family == 'anthropic':
+            # Bedrock's claude text-completion API reports no usage; approximate it by length
+            completion = r['completion']
+            prompt_tokens = len(chat.generic_chat(format='claude'))
+            completion_tokens = len(completion)
+            return ModelChatResponse(
+                content=completion,
+                role='assistant',
+                usage=UsageModel(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens
                 )
-            })
-        elif self.model.startswith('meta'):
-            return ModelChatResponse(**{
-                'content': r['generation'],
-                'role': 'assistant',
-                'usage': UsageModel(
-                    prompt_tokens=r['prompt_token_count'],
-                    completion_tokens=r['generation_token_count'],
-                    total_tokens=r['prompt_token_count'] + r['generation_token_count']
+            )
+        elif self._family == 'meta':
+            prompt_tokens = r['prompt_token_count']
+            completion_tokens = r['generation_token_count']
+            return ModelChatResponse(
+                content=r['generation'],
+                role='assistant',
+                usage=UsageModel(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens
                 )
-            })
+            )
 
-    @BaseChat.sync_intercept_stream_generate
-    def stream_generate(self, chat: ModelChat, **kwargs):
-        response = self.client.invoke_model_with_response_stream(
+    def _invoke(self, chat: ModelChat, kwargs: dict) -> dict:
+        # Body building, the request and the parse run together so async callers
+        # pay a single thread hop and never encode or decode JSON on the event loop.
+        response = self.client.invoke_model(body=self.prepare_data(chat, **kwargs),
+                                            modelId=self.model,
+                                            accept='application/json',
+                                            contentType='application/json')
+        return fast_json.loads(response.get('body').read())
+
+    def _invoke_stream(self, chat: ModelChat, kwargs: dict):
+        return self.client.invoke_model_with_response_stream(
             body=self.prepare_data(chat, **kwargs),
             modelId=self.model,
             accept='application/json',
             contentType='application/json')
-        for event in response.get("body"):
-            event = json.loads(event["chunk"]["bytes"])
-            chunk = self.format_event_to_chunk(event)
-            prompt_tokens = event.get('amazon-bedrock-invocationMetrics', {}).get('inputTokenCount', 0)
-            completion_tokens = event.get('amazon-bedrock-invocationMetrics', {}).get('outputTokenCount', 0)
-            chunk.usage = UsageModel(**{
-                'prompt_tokens': prompt_tokens,
-                'completion_tokens': completion_tokens,
-                'total_tokens': prompt_tokens + completion_tokens,
-            })
-            yield chunk
+
+    @BaseChat.async_intercept_generate
+    async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
+        r = await asyncio.get_running_loop().run_in_executor(self._invoke_executor, self._invoke, chat, kwargs)
+        return self.process_generate(r, chat)
+
+    @BaseChat.sync_intercept_generate
+    def generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
+        return self.process_generate(self._invoke(chat, kwargs), chat)
+
+    @BaseChat.sync_intercept_stream_generate
+    def stream_generate(self, chat: ModelChat, **kwargs):
+        response = self._invoke_stream(chat, kwargs)
+        yield from self._parse_stream(response.get("body"))
 
     @BaseChat.async_intercept_stream_generate
     async def async_stream_generate(self, chat: ModelChat, **kwargs):
-        body = self.prepare_data(chat, **kwargs)
-
-        async with self.aclient as client:
-            response = await client.invoke_model_with_response_stream(
-                body=body,
-                modelId=self.model,
-                accept='application/json',
-                contentType='application/json')
-            async for event in response.get("body"):
-                event = json.loads(event["chunk"]["bytes"])
-                chunk = self.format_event_to_chunk(event)
-                prompt_tokens = event.get('amazon-bedrock-invocationMetrics', {}).get('inputTokenCount', 0)
-                completion_tokens = event.get('amazon-bedrock-invocationMetrics', {}).get('outputTokenCount', 0)
-                chunk.usage = UsageModel(**{
-                    'prompt_tokens': prompt_tokens,
-                    'completion_tokens': completion_tokens,
-                    'total_tokens': prompt_tokens + completion_tokens,
-                })
-                yield chunk
-
-    def format_event_to_chunk(self, event):
-        if self.model.startswith('anthropic'):
-            chunk = {
-                'id': '1',
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': event['completion'],
-                                'role': None
-                            },
-                        'finish_reason': 'stop' if event['stop_reason'] else None,
-                        'index': 0
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'object': 'chat.completion.chunk'
-            }
-        elif self.model.startswith('amazon.nova'):
-            chunk = {
-                'id': '1',
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': event.get('contentBlockDelta', {}).get('delta', {}).get('text'),
-                                'role': None
-                            },
-                        'finish_reason': 'stop' if event.get('messageStop', {}).get(
-                            'stopReason') == 'end_turn' else None,
-                        'index': event.get('index')
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'object': 'chat.completion.chunk'
-            }
-            if c := chunk.get('metadata', {}).get('usage'):
-                chunk['usage'] = UsageModel(prompt_tokens=c['inputTokens'],
-                                            completion_tokens=c['outputTokens'],
-                                            total_tokens=c['inputTokens'] + c['outputTokens'])
-
-        elif self.model.startswith('amazon'):
-            chunk = {
-                'id': '1',
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': event['outputText'],
-                                'role': None
-                            },
-                        'finish_reason': 'stop' if event['completionReason'] == 'FINISH' else None,
-                        'index': event['index']
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'object': 'chat.completion.chunk'
-            }
-        elif self.model.startswith('meta'):
-            chunk = {
-                'id': '1',
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': event['generation'],
-                                'role': None
-                            },
-                        'finish_reason': 'stop' if event['stop_reason'] else None,
-                        'index': 0
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'object': 'chat.completion.chunk'
-            }
+        response = await asyncio.get_running_loop().run_in_executor(self._invoke_executor,
+                                                                    self._invoke_stream, chat, kwargs)
+        async for chunk in _iterate_in_thread(response.get("body"), self._stream_executor, self._parse_stream):
+            yield chunk
+
+    def _parse_stream(self, body):
+        created = time.time_ns() // 1_000_000_000
+        format_chunk = self._chunk_formatter()
+        for event in body:
+            event = fast_json.loads(event["chunk"]["bytes"])
+            chunk = format_chunk(self, event, created)
+            if (invocation_metrics := event.get('amazon-bedrock-invocationMetrics')) is not None:
+                prompt_tokens = invocation_metrics.get('inputTokenCount', 0)
+                completion_tokens = invocation_metrics.get('outputTokenCount', 0)
+                chunk.usage = UsageModel(prompt_tokens=prompt_tokens,
+                                         completion_tokens=completion_tokens,
+                                         total_tokens=prompt_tokens + completion_tokens)
+            yield chunk
+
+    def _build_chunk(self, content, finish_reason, created: int, index=0, usage=None) -> ChatCompletionModel:
+        # Shared skeleton for every model family. Chunks are assembled from already-parsed
+        # Bedrock events, so pydantic validation is skipped.
+        return ChatCompletionModel.model_construct(
+            id='1',
+            choices=[ChoiceModel.model_construct(
+                delta=DeltaModel.model_construct(content=content, role=None),
+                finish_reason=finish_reason,
+                index=index
+            )],
+            created=created,
+            model=self.model,
+            object='chat.completion.chunk',
+            usage=_empty_usage() if usage is None else usage
+        )
+
+    def _claude_chunk(self, event: dict, created: int) -> ChatCompletionModel:
+        return self._build_chunk(event['completion'], 'stop' if event['stop_reason'] else None, created)
+
+    def _nova_chunk(self, event: dict, created: int) -> ChatCompletionModel:
+        # Nearly every Nova event is a text delta, check for it before the rarer shapes
+        if (block := event.get('contentBlockDelta')) is not None:
+            return self._build_chunk(block.get('delta', {}).get('text'), None, created, event.get('index'))
+        if (stop := event.get('messageStop')) is not None:
+            finish_reason = _NOVA_STOP_REASONS.get(stop.get('stopReason'))
         else:
-            raise Exception('Unrecognized')
-        return ChatCompletionModel(**chunk)
+            finish_reason = None
+        return self._build_chunk(None, finish_reason, created, event.get('index'))
+
+    def _titan_chunk(self, event: dict, created: int) -> ChatCompletionModel:
+        return self._build_chunk(event['outputText'],
+                                 'stop' if event['completionReason'] == 'FINISH' else None,
+                                 created,
+                                 event['index'])
+
+    def _llama_chunk(self, event: dict, created: int) -> ChatCompletionModel:
+        return self._build_chunk(event['generation'], 'stop' if event['stop_reason'] else None, created)
+
+    # Stream event formatter per model family
+    _CHUNK_FORMATTERS = MappingProxyType({
+        'anthropic': _claude_chunk,
+        'nova': _nova_chunk,
+        'titan': _titan_chunk,
+        'meta': _llama_chunk,
+    })
+
+    def _chunk_formatter(self):
+        try:
+            return self._CHUNK_FORMATTERS[self._family]
+        except KeyError:
+            raise Exception('Unrecognized') from None
+
+    def format_event_to_chunk(self, event, created: int | None = None):
+        # Every chunk of a completion stream shares the same `created` stamp
+        if created is None:
+            created = time.time_ns() // 1_000_000_000
+        return self._chunk_formatter()(self, event, created)
+
+    def format_events_to_chunks(self, events: list, created: int | None = None) -> list:
+        if created is None:
+            created = time.time_ns() // 1_000_000_000
+        return [self.format_event_to_chunk(event, created) for event in events]
 
     def audio_speech(self, data: AudioSpeechRequest, **kwargs):
         response = self.client.synthesize_speech(
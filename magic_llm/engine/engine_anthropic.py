@@ -1,10 +1,13 @@
 # https://docs.anthropic.com/claude/reference/messages-streaming
-import json
+import asyncio
 import time
 
+import aiohttp
+
 from magic_llm.engine.base_chat import BaseChat
 from magic_llm.model import ModelChat, ModelChatResponse
-from magic_llm.model.ModelChatStream import ChatCompletionModel, UsageModel
+from magic_llm.model.ModelChatStream import ChatCompletionModel, ChoiceModel, DeltaModel, UsageModel
+from magic_llm.util import fast_json
 from magic_llm.util.http import AsyncHttpClient, HttpClient
 
 
@@ -15,8 +18,40 @@ class EngineAnthropic(BaseChat):
         super().__init__(**kwargs)
         self.base_url = 'https://api.anthropic.com/v1/messages'
         self.api_key = api_key
+        # Keep-alive sessions opened by `async with engine`, one per event loop since aiohttp
+        # binds a session to its loop: loop -> [session, nested users]. Outside such a block
+        # every async call uses (and closes) a session of its own.
+        self._sessions = {}
+
+    def _get_session(self) -> aiohttp.ClientSession | None:
+        entry = self._sessions.get(asyncio.get_running_loop())
+        return entry[0] if entry is not None and not entry[0].closed else None
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+            entry = self._sessions[loop] = [session, 0]
+        entry[1] += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                await self.aclose()
 
-    def prepare_chunk(self, event: dict, idx, usage):
+    async def aclose(self) -> None:
+        """Close the keep-alive session of the running loop."""
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None and not entry[0].closed:
+            await entry[0].close()
+
+    def prepare_chunk(self, event: dict, idx, usage, created: int | None = None):
         chunk = None
         finish_reason = None
         if event['type'] == 'message_start':
@@ -49,7 +84,7 @@ class EngineAnthropic(BaseChat):
                     'finish_reason': finish_reason,
                     'index': 0
                 }],
-                'created': int(time.time()),
+                'created': int(time.time()) if created is None else created,
                 'model': self.model,
                 'usage': usage,
                 'object': 'chat.completion.chunk'
@@ -136,28 +171,36 @@ class EngineAnthropic(BaseChat):
         if preamble:
             data['system'] = preamble
 
-        json_data = json.dumps(data).encode('utf-8')
+        json_data = fast_json.dumps(data)
         return json_data, headers
 
-    def process_chunk(self, chunk: str, idx, usage):
-        chunk, idx, usage = self.prepare_chunk(json.loads(chunk), idx, usage)
+    def process_chunk(self, chunk: str | bytes, idx, usage, created: int | None = None):
+        chunk, idx, usage = self.prepare_chunk(fast_json.loads(chunk), idx, usage, created)
         return ChatCompletionModel(**chunk) if chunk else None, idx, usage
 
+    def _final_chunk(self, idx, usage, created: int) -> ChatCompletionModel:
+        # Empty closing chunk carrying the usage totals of the whole stream
+        return ChatCompletionModel(id=idx,
+                                   choices=[ChoiceModel(delta=DeltaModel(content='', role=None))],
+                                   created=created,
+                                   model=self.model,
+                                   usage=usage)
+
     def process_generate(self, r):
-        return ModelChatResponse(**{
-            'content': r['content'][0]['text'],
-            'role': 'assistant',
-            'usage': UsageModel(
+        return ModelChatResponse(
+            content=r['content'][0]['text'],
+            role='assistant',
+            usage=UsageModel(
                 prompt_tokens=r['usage']['input_tokens'],
                 completion_tokens=r['usage']['output_tokens'],
                 total_tokens=r['usage']['input_tokens'] + r['usage']['output_tokens'],
             )
-        })
+        )
 
     @BaseChat.async_intercept_generate
     async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
         json_data, headers = self.prepare_data(chat, **kwargs)
-        async with AsyncHttpClient() as client:
+        async with AsyncHttpClient(self._get_session()) as client:
             response = await client.post_json(url=self.base_url,
                                               data=json_data,
                                               headers=headers,
@@ -181,72 +224,43 @@ class EngineAnthropic(BaseChat):
         with HttpClient() as client:
             idx = None
             usage = None
+            # Every chunk of a completion stream shares the same `created` stamp
+            created = int(time.time())
+            # Chunked SSE responses hand over what arrived up to chunk_size, so a larger
+            # read means fewer loop iterations without holding back tokens
             for chunk in client.stream_request("POST",
                                                self.base_url,
+                                               chunk_size=8192,
                                                data=json_data,
                                                headers=headers,
                                                timeout=kwargs.get('timeout')):
                 if chunk:
-                    evt = chunk.split('data:')
-                    if len(evt) != 2:
+                    # Only the first 'data:' is the field name, the payload may contain it too
+                    _, sep, payload = chunk.partition('data:')
+                    if not sep:
                         continue
-                    if c := self.process_chunk(evt[-1].strip(), idx, usage):
-                        idx = c[1]
-                        usage = c[2]
-                        if c[0]:
-                            yield c[0]
-            chunk = {
-                'id': idx,
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': '',
-                                'role': None
-                            },
-                        'finish_reason': None,
-                        'index': 0
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'usage': usage,
-                'object': 'chat.completion.chunk'
-            }
-            yield ChatCompletionModel(**chunk)
+                    c, idx, usage = self.process_chunk(payload, idx, usage, created)
+                    if c:
+                        yield c
+            yield self._final_chunk(idx, usage, created)
 
     @BaseChat.async_intercept_stream_generate
     async def async_stream_generate(self, chat: ModelChat, **kwargs):
         json_data, headers = self.prepare_data(chat, stream=True, **kwargs)
-        async with AsyncHttpClient() as client:
+        async with AsyncHttpClient(self._get_session()) as client:
             idx = None
             usage = None
+            # Every chunk of a completion stream shares the same `created` stamp
+            created = int(time.time())
             async for chunk in client.post_stream(self.base_url,
                                                   data=json_data,
                                                   headers=headers):
                 if chunk:
-                    evt = chunk.decode().split('data:')
-                    if len(evt) != 2:
+                    # The JSON decoder takes the raw bytes, no str round trip
+                    _, sep, payload = chunk.partition(b'data:')
+                    if not sep:
                         continue
-                    if c := self.process_chunk(evt[-1].strip(), idx, usage):
-                        idx = c[1]
-                    usage = c[2]
-                    if c[0]:
-                        yield c[0]
-            chunk = {
-                'id': idx,
-                'choices':
-                    [{
-                        'delta':
-                            {
-                                'content': '',
-                                'role': None
-                            },
-                        'finish_reason': None,
-                        'index': 0
-                    }],
-                'created': int(time.time()),
-                'model': self.model,
-                'usage': usage,
-                'object': 'chat.completion.chunk'
-            }
-            yield ChatCompletionModel(**chunk)
+                    c, idx, usage = self.process_chunk(payload, idx, usage, created)
+                    if c:
+                        yield c
+            yield self._final_chunk(idx, usage, created)
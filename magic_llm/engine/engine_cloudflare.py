@@ -34,15 +34,15 @@ class EngineCloudFlare(BaseChat):
 
     def process_generate(self, r):
         r = r['result']['response']
-        return ModelChatResponse(**{
-            'content': r,
-            'role': 'assistant',
-            'usage': UsageModel(
+        return ModelChatResponse(
+            content=r,
+            role='assistant',
+            usage=UsageModel(
                 prompt_tokens=0,
                 completion_tokens=0,
                 total_tokens=0,
             )
-        })
+        )
 
     @BaseChat.async_intercept_generate
     async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
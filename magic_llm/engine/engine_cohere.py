@@ -45,15 +45,15 @@ class EngineCohere(BaseChat):
         return json_data, headers
 
     def process_generate(self, r: dict):
-        return ModelChatResponse(**{
-            'content': r['text'],
-            'role': 'assistant',
-            'usage': UsageModel(
+        return ModelChatResponse(
+            content=r['text'],
+            role='assistant',
+            usage=UsageModel(
                 prompt_tokens=r['meta']['tokens']['input_tokens'],
                 completion_tokens=r['meta']['tokens']['output_tokens'],
                 total_tokens=r['meta']['tokens']['input_tokens'] + r['meta']['tokens']['output_tokens'],
             )
-        })
+        )
 
     @BaseChat.async_intercept_generate
     async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
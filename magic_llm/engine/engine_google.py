@@ -50,15 +50,15 @@ class EngineGoogle(BaseChat):
 
     def process_generate(self, data: dict):
         content = data['candidates'][0]['content']['parts'][0]['text']
-        return ModelChatResponse(**{
-            'content': content,
-            'role': 'assistant',
-            'usage': UsageModel(
+        return ModelChatResponse(
+            content=content,
+            role='assistant',
+            usage=UsageModel(
                 prompt_tokens=data['usageMetadata']['promptTokenCount'],
                 completion_tokens=data['usageMetadata']['candidatesTokenCount'],
                 total_tokens=data['usageMetadata']['totalTokenCount']
             )
-        })
+        )
 
     @BaseChat.async_intercept_generate
     async def async_generate(self, chat: ModelChat, **kwargs) -> ModelChatResponse:
@@ -7,9 +7,15 @@ import aiohttp
 
 from magic_llm.model import ModelChat
 from magic_llm.model.ModelAudio import AudioSpeechRequest, AudioTranscriptionsRequest
-from magic_llm.model.ModelChatStream import ChatCompletionModel
+from magic_llm.model.ModelChatStream import ChatCompletionModel, ChoiceModel, DeltaModel
 from magic_llm.util.http import AsyncHttpClient
 
+# BaseChat options forwarded along with the engine kwargs that must not reach the request body
+ENGINE_OPTIONS = ('callback', 'fallback', 'retries', 'executor', 'circuit_breaker', 'chunk_timeout',
+                  'chunk_callback', 'callback_batch_size', 'stream_buffer',
+                  'coalesce_size', 'coalesce_interval', 'cache', 'await_callback',
+                  'stream_metrics')
+
 
 class OpenAiBaseProvider(ABC):
     def __init__(self,
@@ -56,10 +62,8 @@ class OpenAiBaseProvider(ABC):
             **kwargs,
             **self.kwargs
         }
-        if 'callback' in data:
-            data.pop('callback')
-        if 'fallback' in data:
-            data.pop('fallback')
+        for option in ENGINE_OPTIONS:
+            data.pop(option, None)
         json_data = json.dumps(data).encode('utf-8')
         return json_data, self.headers
 
@@ -78,17 +82,9 @@ class OpenAiBaseProvider(ABC):
         else:
             if chunk.strip():
                 if not chunk.endswith('[DONE]') and not chunk.lower().startswith(': ping'):
-                    return ChatCompletionModel(**{
-                        'id': '0',
-                        'model': 'dummy',
-                        'choices': [
-                            {
-                                'delta': {
-                                    'content': chunk
-                                }
-                            }
-                        ]
-                    })
+                    return ChatCompletionModel(id='0',
+                                               model='dummy',
+                                               choices=[ChoiceModel(delta=DeltaModel(content=chunk))])
 
     def prepare_transcriptions(self, data: AudioTranscriptionsRequest):
         form_data = aiohttp.FormData()
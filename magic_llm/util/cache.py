@@ -0,0 +1,57 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache for completed responses.
+
+    Entries older than ``ttl`` seconds are treated as missing; ``ttl=None`` keeps them
+    until evicted. ``stats`` counts hits and misses.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0}
+        # key -> (monotonic expiry or None, value)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                if entry is not None:
+                    del self._data[key]
+                self.stats['misses'] += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.stats['hits'] = self.stats['misses'] = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_key(model: Optional[str], messages: list, params: dict, kind: str = 'generate') -> str:
+    """Stable digest of everything that determines a completion."""
+    payload = json.dumps({'kind': kind, 'model': model, 'messages': messages, 'params': params},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
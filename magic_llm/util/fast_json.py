@@ -0,0 +1,15 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    loads = json.loads
@@ -9,17 +9,21 @@ from requests import RequestException
 class AsyncHttpClient:
     """
     A reusable HTTP client for making asynchronous requests using aiohttp.
+
+    A ``session`` passed in is used as is and left open on exit, its owner closes it.
     """
 
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: aiohttp.ClientSession | None = None):
+        self.session = session
+        self._owns_session = session is None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def request(
@@ -158,7 +162,7 @@ class HttpClient:
             # Preserve the original error but add more context if possible
             if hasattr(e.response, 'content'):
                 error_message = f"{str(e)}: {e.response.content.decode('utf-8', errors='replace')}"
-                raise type(e)(error_message) from None
+                raise type(e)(error_message, response=e.response, request=e.request) from None
             raise
 
     def post_json(self, url: str, **kwargs) -> Any:
@@ -188,6 +192,7 @@ class HttpClient:
             self,
             method: str,
             url: str,
+            chunk_size: int = 512,
             **kwargs
     ) -> Generator[str, None, None]:
         """
@@ -195,6 +200,7 @@ class HttpClient:
 
         :param method: The HTTP method (e.g., 'POST', 'GET', etc.).
         :param url: The endpoint URL.
+        :param chunk_size: Maximum bytes read from the socket per iteration.
         :param kwargs: Additional arguments for requests.
         :yield: Lines of text from the response.
         :raises: requests.exceptions.RequestException
@@ -209,12 +215,12 @@ class HttpClient:
             with self.session.request(method, url, **kwargs) as response:
                 response.raise_for_status()
                 # yield from response.iter_lines(decode_unicode=False)
-                for line in response.iter_lines(decode_unicode=False):
+                for line in response.iter_lines(chunk_size=chunk_size, decode_unicode=False):
                     if line:
                         yield line.decode('utf-8')
         except RequestException as e:
             # Add context to the error if possible
             if hasattr(e.response, 'content'):
                 error_message = f"{str(e)}: {e.response.content.decode('utf-8', errors='replace')}"
-                raise type(e)(error_message) from None
+                raise type(e)(error_message, response=e.response, request=e.request) from None
             raise